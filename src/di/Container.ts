@@ -57,7 +57,6 @@ export class Container {
   get migrationService(): MigrationService {
     if (!this._migrationService) {
       this._migrationService = new DefaultMigrationService(
-        this._gridUtils,
         this._mathUtils,
         this._randomUtils
       );
@@ -84,8 +83,7 @@ export class Container {
       this._simulationManager = new DefaultSimulationManager(
         this.biomassService,
         this.bisonService,
-        this.migrationService,
-        this._gridUtils
+        this.migrationService
       );
     }
     return this._simulationManager;
@@ -7,7 +7,6 @@ import { Grid } from "../models/Grid";
 import { BiomassService } from "../services/BiomassService";
 import { BisonService } from "../services/BisonService";
 import { MigrationService } from "../services/MigrationService";
-import { GridUtils } from "../utils/GridUtils";
 
 export interface SimulationManager {
   runSimulation(
@@ -30,8 +29,7 @@ export class DefaultSimulationManager implements SimulationManager {
   constructor(
     private readonly biomassService: BiomassService,
     private readonly bisonService: BisonService,
-    private readonly migrationService: MigrationService,
-    private readonly gridUtils: GridUtils
+    private readonly migrationService: MigrationService
   ) {}
 
   async runSimulation(
@@ -119,20 +117,14 @@ export class DefaultSimulationManager implements SimulationManager {
       config.biomass
     );
 
-    // Calculate food demand
-    const foodDemand = this.bisonService.calculateFoodDemand(
-      currentState.bison.population,
-      config.bison
-    );
-
-    // Calculate consumption (min of available and demand)
-    const consumed = this.gridUtils.minimum(sustainableHarvest, foodDemand);
-
-    // Calculate food satisfaction
-    const foodSatisfaction = this.bisonService.calculateFoodSatisfaction(
-      foodDemand,
-      consumed
-    );
+    // Calculate food demand, consumption (min of available and demand)
+    // and food satisfaction in one pass
+    const { consumed, foodSatisfaction } =
+      this.bisonService.calculateConsumption(
+        currentState.bison.population,
+        sustainableHarvest,
+        config.bison
+      );
 
     // Calculate carrying capacity
     const carryingCapacity = this.bisonService.calculateCarryingCapacity(
@@ -211,18 +203,12 @@ export class DefaultSimulationManager implements SimulationManager {
       config.biomass
     );
 
-    const foodDemand = this.bisonService.calculateFoodDemand(
-      population,
-      config.bison
-    );
-    const consumed = this.gridUtils.minimum(
-      biomassState.sustainableHarvest,
-      foodDemand
-    );
-    const foodSatisfaction = this.bisonService.calculateFoodSatisfaction(
-      foodDemand,
-      consumed
-    );
+    const { foodDemand, foodSatisfaction } =
+      this.bisonService.calculateConsumption(
+        population,
+        biomassState.sustainableHarvest,
+        config.bison
+      );
     const carryingCapacity = this.bisonService.calculateCarryingCapacity(
       biomassState.sustainableHarvest,
       config.bison
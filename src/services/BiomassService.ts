@@ -98,11 +98,22 @@ export class DefaultBiomassService implements BiomassService {
     consumed: Grid<number>,
     config: BiomassConfig
   ): Grid<number> {
-    // new_biomass = current + regrowth - consumed
-    const regrowth = this.calculateRegrowth(current, max, config);
-    const afterGrowth = this.gridUtils.add(current, regrowth);
-    const afterConsumption = this.gridUtils.subtract(afterGrowth, consumed);
-    return this.gridUtils.clip(afterConsumption, 0, Number.MAX_VALUE);
+    // new_biomass = max(0, current + regrowth - consumed), computed in one
+    // pass into a single output grid instead of four intermediate grids
+    const result = new NumericGrid(current.width, current.height, current.cellSizeKm, 0);
+    const out = result.getData();
+    const currentData = current.getData();
+    const maxData = max.getData();
+    const consumedData = consumed.getData();
+    const growthFactor = config.annualGrowthFactor;
+
+    for (let i = 0; i < out.length; i++) {
+      const biomass = currentData[i];
+      const regrowth = (maxData[i] - biomass) * growthFactor;
+      out[i] = Math.max(0, biomass + regrowth - consumedData[i]);
+    }
+
+    return result;
   }
 
   createMaxBiomass(biomass: Grid<number>, config: BiomassConfig): Grid<number> {
@@ -114,14 +125,12 @@ export class DefaultBiomassService implements BiomassService {
     max: Grid<number>,
     config: BiomassConfig
   ): BiomassState {
+    const digestible = this.calculateDigestibleBiomass(biomass, config);
     return {
       current: biomass,
       max,
-      digestible: this.calculateDigestibleBiomass(biomass, config),
-      sustainableHarvest: this.calculateSustainableHarvest(
-        this.calculateDigestibleBiomass(biomass, config),
-        config
-      ),
+      digestible,
+      sustainableHarvest: this.calculateSustainableHarvest(digestible, config),
     };
   }
 }
@@ -5,6 +5,12 @@ import { GridUtils } from "../utils/GridUtils";
 import { MathUtils } from "../utils/MathUtils";
 import { RandomUtils } from "../utils/RandomUtils";
 
+export interface FoodConsumption {
+  foodDemand: Grid<number>;
+  consumed: Grid<number>;
+  foodSatisfaction: Grid<number>;
+}
+
 export interface BisonService {
   initializePopulation(
     shape: { width: number; height: number },
@@ -21,6 +27,11 @@ export interface BisonService {
     demand: Grid<number>,
     consumed: Grid<number>
   ): Grid<number>;
+  calculateConsumption(
+    population: Grid<number>,
+    sustainableHarvest: Grid<number>,
+    config: BisonConfig
+  ): FoodConsumption;
   calculateCarryingCapacity(
     sustainableHarvest: Grid<number>,
     config: BisonConfig
@@ -39,6 +50,16 @@ export interface BisonService {
   ): BisonState;
 }
 
+// Per-cell state bits used by updatePopulation
+const VIABLE = 4; // at or above the minimum viable density
+const WELL_FED = 2; // food satisfaction above the starvation threshold
+const PIONEERING = 1; // well below carrying capacity
+
+// Dry-matter intake per bison per year, in tonnes
+function annualIntakeTonnes(config: BisonConfig): number {
+  return (config.bodyMassKg * config.dailyIntakeRate * 365) / 1000;
+}
+
 export class DefaultBisonService implements BisonService {
   constructor(
     private readonly gridUtils: GridUtils,
@@ -97,25 +118,25 @@ export class DefaultBisonService implements BisonService {
         centerCol = Math.floor(shape.width / 2);
     }
 
-    // Find all valid land cells within the release radius
+    // Find all valid land cells within the release radius. Clip the
+    // bounding box to the grid up front rather than testing every cell.
     const validCells: Array<{ row: number; col: number; distance: number }> = [];
-
-    for (let row = centerRow - radius; row <= centerRow + radius; row++) {
-      for (let col = centerCol - radius; col <= centerCol + radius; col++) {
-        if (!population.isValid(row, col)) continue;
+    const radiusSq = radius * radius;
+    const rowMin = Math.max(0, centerRow - radius);
+    const rowMax = Math.min(shape.height - 1, centerRow + radius);
+    const colMin = Math.max(0, centerCol - radius);
+    const colMax = Math.min(shape.width - 1, centerCol + radius);
+
+    for (let row = rowMin; row <= rowMax; row++) {
+      for (let col = colMin; col <= colMax; col++) {
+        // Only include cells within circular radius
+        const distanceSq = (row - centerRow) ** 2 + (col - centerCol) ** 2;
+        if (distanceSq > radiusSq) continue;
 
         // Check if on land
         if (landMask && landMask.get(row, col) <= 0) continue;
 
-        // Calculate distance from center
-        const distance = Math.sqrt(
-          Math.pow(row - centerRow, 2) + Math.pow(col - centerCol, 2)
-        );
-
-        // Only include cells within circular radius
-        if (distance <= radius) {
-          validCells.push({ row, col, distance });
-        }
+        validCells.push({ row, col, distance: Math.sqrt(distanceSq) });
       }
     }
 
@@ -130,11 +151,11 @@ export class DefaultBisonService implements BisonService {
     const totalWeight = weights.reduce((sum, w) => sum + w, 0);
 
     let remainingPop = totalPop;
-    const cellPopulations = new Map<string, number>();
+    // Bison per valid cell, indexed like validCells
+    const cellPopulations = new Float64Array(validCells.length);
 
     // First pass: distribute based on weights
     for (let i = 0; i < validCells.length && remainingPop > 0; i++) {
-      const cell = validCells[i];
       const expectedPop = (weights[i] / totalWeight) * totalPop;
 
       // Add some randomness with Poisson distribution
@@ -144,30 +165,32 @@ export class DefaultBisonService implements BisonService {
       );
 
       if (cellPop > 0) {
-        cellPopulations.set(`${cell.row},${cell.col}`, cellPop);
+        cellPopulations[i] = cellPop;
         remainingPop -= cellPop;
       }
     }
 
     // If we still have remaining population, add to random valid cells
-    while (remainingPop > 0 && validCells.length > 0) {
+    while (remainingPop > 0) {
       const idx = Math.floor(this.randomUtils.random() * validCells.length);
-      const cell = validCells[idx];
-      const key = `${cell.row},${cell.col}`;
-      const current = cellPopulations.get(key) || 0;
-      cellPopulations.set(key, current + 1);
+      cellPopulations[idx] += 1;
       remainingPop--;
     }
 
     // Apply populations to grid
-    for (const [key, pop] of cellPopulations) {
-      const [row, col] = key.split(",").map(Number);
-      population.set(row, col, pop);
+    let totalPlaced = 0;
+    let occupiedCells = 0;
+    for (let i = 0; i < validCells.length; i++) {
+      const pop = cellPopulations[i];
+      if (pop > 0) {
+        population.set(validCells[i].row, validCells[i].col, pop);
+        totalPlaced += pop;
+        occupiedCells++;
+      }
     }
 
     // Log initialization stats
-    const totalPlaced = Array.from(cellPopulations.values()).reduce((a, b) => a + b, 0);
-    console.log(`Initialized ${totalPlaced} bison across ${cellPopulations.size} cells`);
+    console.log(`Initialized ${totalPlaced} bison across ${occupiedCells} cells`);
     console.log(`  Center: (${centerRow}, ${centerCol}), Radius: ${radius} cells`);
 
     return population;
@@ -178,8 +201,7 @@ export class DefaultBisonService implements BisonService {
     config: BisonConfig
   ): Grid<number> {
     // Food demand = population * intake per bison per year
-    const intakeTonnesPerYear =
-      (config.bodyMassKg * config.dailyIntakeRate * 365) / 1000;
+    const intakeTonnesPerYear = annualIntakeTonnes(config);
     return this.gridUtils.scale(population, intakeTonnesPerYear);
   }
 
@@ -206,13 +228,49 @@ export class DefaultBisonService implements BisonService {
     return result;
   }
 
+  calculateConsumption(
+    population: Grid<number>,
+    sustainableHarvest: Grid<number>,
+    config: BisonConfig
+  ): FoodConsumption {
+    // Fused demand -> consumption -> satisfaction pass; equivalent to
+    // calculateFoodDemand, minimum(harvest, demand) and
+    // calculateFoodSatisfaction without the intermediate grid passes
+    const { width, height, cellSizeKm } = population;
+    const foodDemand = new NumericGrid(width, height, cellSizeKm, 0);
+    const consumed = new NumericGrid(width, height, cellSizeKm, 0);
+    const foodSatisfaction = new NumericGrid(width, height, cellSizeKm, 0);
+
+    const demandData = foodDemand.getData();
+    const consumedData = consumed.getData();
+    const satisfactionData = foodSatisfaction.getData();
+    const popData = population.getData();
+    const harvestData = sustainableHarvest.getData();
+
+    const intakeTonnesPerYear = annualIntakeTonnes(config);
+
+    for (let i = 0; i < demandData.length; i++) {
+      // Round through the grid storage so results match the unfused path
+      demandData[i] = popData[i] * intakeTonnesPerYear;
+      const demandVal = demandData[i];
+      consumedData[i] = Math.min(harvestData[i], demandVal);
+      const consumedVal = consumedData[i];
+
+      satisfactionData[i] =
+        demandVal > 0
+          ? this.mathUtils.clamp(consumedVal / demandVal, 0, 1)
+          : 1.0;
+    }
+
+    return { foodDemand, consumed, foodSatisfaction };
+  }
+
   calculateCarryingCapacity(
     sustainableHarvest: Grid<number>,
     config: BisonConfig
   ): Grid<number> {
     // carrying_capacity = sustainable_harvest / intake_per_bison
-    const intakeTonnesPerYear =
-      (config.bodyMassKg * config.dailyIntakeRate * 365) / 1000;
+    const intakeTonnesPerYear = annualIntakeTonnes(config);
     return this.gridUtils.scale(sustainableHarvest, 1 / intakeTonnesPerYear);
   }
 
@@ -230,46 +288,66 @@ export class DefaultBisonService implements BisonService {
     );
     const epsilon = 1e-10;
 
-    for (let row = 0; row < population.height; row++) {
-      for (let col = 0; col < population.width; col++) {
-        const pop = population.get(row, col);
-        const capacity = carryingCapacity.get(row, col);
-        const satisfaction = foodSatisfaction.get(row, col);
-
-        // Check if population is viable
-        const isViable = pop >= config.minViableDensity;
-
-        // Calculate capacity ratio
-        const capacityRatio = pop / (capacity + epsilon);
-
-        // Pioneer bonus for establishing populations
-        const capacityBonus = this.mathUtils.clamp(capacity / 10.0, 0, 0.3);
-        const pioneerBonus =
-          isViable && capacityRatio < 0.3
-            ? config.pioneerBonus + capacityBonus
-            : capacityBonus;
-
-        // Calculate growth factor
-        let growthFactor: number;
-        if (satisfaction > config.starvationThreshold) {
-          growthFactor =
-            (config.maxGrowthRate + pioneerBonus) *
-            satisfaction *
-            (1 - capacityRatio) *
-            (isViable ? 1 : 0);
-        } else {
+    // Single fused pass over the backing arrays: the whole per-cell state
+    // machine runs on flat indices instead of bounds-checked get/set
+    const out = result.getData();
+    const popData = population.getData();
+    const capacityData = carryingCapacity.getData();
+    const satisfactionData = foodSatisfaction.getData();
+
+    const {
+      minViableDensity,
+      starvationThreshold,
+      maxGrowthRate,
+      pioneerBonus: basePioneerBonus,
+    } = config;
+
+    for (let i = 0; i < out.length; i++) {
+      const pop = popData[i];
+      const capacity = capacityData[i];
+      const satisfaction = satisfactionData[i];
+
+      // Capacity ratio (pop relative to what the cell can support)
+      const capacityRatio = pop / (capacity + epsilon);
+
+      // Classify the cell once, then evaluate only the growth expression
+      // that applies to it
+      const cellState =
+        (pop >= minViableDensity ? VIABLE : 0) |
+        (satisfaction > starvationThreshold ? WELL_FED : 0) |
+        (capacityRatio < 0.3 ? PIONEERING : 0);
+
+      let growthFactor: number;
+      switch (cellState) {
+        case VIABLE | WELL_FED | PIONEERING:
+        case VIABLE | WELL_FED: {
+          // Pioneer bonus for establishing populations
+          const capacityBonus = this.mathUtils.clamp(capacity / 10.0, 0, 0.3);
+          const pioneerBonus =
+            cellState & PIONEERING
+              ? basePioneerBonus + capacityBonus
+              : capacityBonus;
           growthFactor =
-            -config.maxGrowthRate *
-            (1 - satisfaction / config.starvationThreshold);
+            (maxGrowthRate + pioneerBonus) * satisfaction * (1 - capacityRatio);
+          break;
         }
+        case WELL_FED | PIONEERING:
+        case WELL_FED:
+          // Fed but below the Allee threshold: no growth
+          growthFactor = 0;
+          break;
+        default:
+          // Starvation
+          growthFactor =
+            -maxGrowthRate * (1 - satisfaction / starvationThreshold);
+      }
 
-        // Clip growth factor
-        growthFactor = this.mathUtils.clamp(growthFactor, -0.5, 0.9);
+      // Clip growth factor
+      growthFactor = this.mathUtils.clamp(growthFactor, -0.5, 0.9);
 
-        // Update population
-        const newPop = pop * (1 + growthFactor);
-        result.set(row, col, this.mathUtils.clamp(newPop, 0, 1e6));
-      }
+      // Update population
+      const newPop = pop * (1 + growthFactor);
+      out[i] = this.mathUtils.clamp(newPop, 0, 1e6);
     }
 
     return result;
@@ -1,5 +1,16 @@
 import { GridMetadata } from "../models/Grid";
-import { fromArrayBuffer } from "geotiff";
+import { fromArrayBuffer, type GeoTIFFImage } from "geotiff";
+
+// Sample arrays geotiff.js can return for a single band
+type RasterData =
+  | Uint8Array
+  | Int8Array
+  | Uint16Array
+  | Int16Array
+  | Uint32Array
+  | Int32Array
+  | Float32Array
+  | Float64Array;
 
 export interface DataService {
   loadGeoTIFF(
@@ -42,12 +53,17 @@ export class GeoTIFFDataService implements DataService {
       
       // Convert to 2D array
       const data: number[][] = [];
-      const rasterData = rasters[0] as Float32Array | Uint16Array | Int16Array;
+      const rasterData = rasters[0] as RasterData;
+
+      // Rasters may be quantized (e.g. int16 biomass, half the bytes of
+      // float32). Following GDAL, SCALE/OFFSET metadata is applied whenever
+      // present, whatever the sample type.
+      const { scale, offset } = this.getScaleOffset(image);
       
       for (let row = 0; row < height; row++) {
         const rowData: number[] = [];
         for (let col = 0; col < width; col++) {
-          rowData.push(rasterData[row * width + col]);
+          rowData.push(rasterData[row * width + col] * scale + offset);
         }
         data.push(rowData);
       }
@@ -75,6 +91,17 @@ export class GeoTIFFDataService implements DataService {
     }
   }
 
+  private getScaleOffset(image: GeoTIFFImage): { scale: number; offset: number } {
+    const gdalMetadata = (image.getGDALMetadata(0) ?? {}) as Record<string, string>;
+    const scale = parseFloat(gdalMetadata.SCALE);
+    const offset = parseFloat(gdalMetadata.OFFSET);
+
+    return {
+      scale: Number.isFinite(scale) ? scale : 1,
+      offset: Number.isFinite(offset) ? offset : 0,
+    };
+  }
+
   async preprocessBiomassData(
     biomassData: number[][],
     coverageData: number[][],
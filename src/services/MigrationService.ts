@@ -1,6 +1,5 @@
 import { Grid, NumericGrid } from "../models/Grid";
 import { MigrationConfig } from "../models/Config";
-import { GridUtils } from "../utils/GridUtils";
 import { MathUtils } from "../utils/MathUtils";
 import { RandomUtils } from "../utils/RandomUtils";
 
@@ -18,9 +17,61 @@ export interface MigrationService {
   ): Grid<number>;
 }
 
+// Standard deviation of the per-move exploration noise
+const EXPLORATION_NOISE = 0.15;
+
+interface MigrationMove {
+  dx: number;
+  dy: number;
+  // 1 / distance^0.8, fixed per offset so it is computed once at module load
+  distanceFactor: number;
+}
+
+interface ActiveRegion {
+  rowStart: number;
+  rowEnd: number;
+  colStart: number;
+  colEnd: number;
+}
+
+interface PopulationScan {
+  total: number;
+  max: number;
+  active: ActiveRegion | null;
+}
+
+function createMoves(offsets: Array<[number, number]>): MigrationMove[] {
+  return offsets.map(([dx, dy]) => {
+    const distance = Math.max(1.0, Math.sqrt(dx * dx + dy * dy));
+    return { dx, dy, distanceFactor: 1.0 / Math.pow(distance, 0.8) };
+  });
+}
+
+// Movement directions (adjacent + diagonal + medium distance)
+const LOCAL_MOVES = createMoves([
+  // Adjacent
+  [-1, 0], [1, 0], [0, -1], [0, 1],
+  // Diagonal
+  [-1, -1], [1, 1], [-1, 1], [1, -1],
+  // Medium distance
+  [-2, 0], [2, 0], [0, -2], [0, 2],
+  [-2, -2], [2, 2], [-2, 2], [2, -2],
+]);
+
+// Long-distance moves once the population is established
+const ESTABLISHED_MOVES = createMoves([
+  [-5, 0], [5, 0], [0, -5], [0, 5],
+  [-4, -4], [4, 4], [-4, 4], [4, -4],
+]);
+
+// Very long distance moves for healthy herds
+const LONG_DISTANCE_MOVES = createMoves([
+  [-10, 0], [10, 0], [0, -10], [0, 10],
+  [-8, -8], [8, 8],
+]);
+
 export class DefaultMigrationService implements MigrationService {
   constructor(
-    private readonly gridUtils: GridUtils,
     private readonly mathUtils: MathUtils,
     private readonly randomUtils: RandomUtils
   ) {}
@@ -29,21 +80,24 @@ export class DefaultMigrationService implements MigrationService {
     carryingCapacity: Grid<number>,
     config: MigrationConfig
   ): Grid<number> {
-    // Attractiveness based on food availability
-    const base = this.gridUtils.scale(carryingCapacity, config.foodPreferenceWeight);
-    
-    // Add noise
-    const result = new NumericGrid(base.width, base.height, base.cellSizeKm, 0);
+    const result = new NumericGrid(
+      carryingCapacity.width,
+      carryingCapacity.height,
+      carryingCapacity.cellSizeKm,
+      0
+    );
     const noiseLevel = Math.min(0.15, config.movementNoise * 0.01);
-    
-    for (let row = 0; row < base.height; row++) {
-      for (let col = 0; col < base.width; col++) {
-        const noise = this.randomUtils.randomNormal(0, noiseLevel);
-        const value = this.mathUtils.clamp(base.get(row, col) + noise, 0, 1000);
-        result.set(row, col, value);
-      }
+    const weight = config.foodPreferenceWeight;
+
+    // Attractiveness based on food availability, plus noise, written
+    // straight into the output without an intermediate scaled grid
+    const capacityData = carryingCapacity.getData();
+    const out = result.getData();
+    for (let i = 0; i < out.length; i++) {
+      const noise = this.randomUtils.randomNormal(0, noiseLevel);
+      out[i] = this.mathUtils.clamp(capacityData[i] * weight + noise, 0, 1000);
     }
-    
+
     return result;
   }
 
@@ -58,52 +112,62 @@ export class DefaultMigrationService implements MigrationService {
       this.randomUtils.setSeed(seed);
     }
 
-    const newPopulation = population.clone() as NumericGrid;
-
     // Calculate diffusion rate based on annual migration distance
     const cellsPerYear = config.annualMigrationKm / population.cellSizeKm;
     const diffusionRate = Math.min(0.95, cellsPerYear / 10);
+    const maxRate = Math.min(0.9, cellsPerYear / 10);
 
-    // Define movement directions (adjacent + diagonal + longer distances)
-    const moves: Array<{dx: number, dy: number}> = [
-      // Adjacent
-      {dx: -1, dy: 0}, {dx: 1, dy: 0}, {dx: 0, dy: -1}, {dx: 0, dy: 1},
-      // Diagonal
-      {dx: -1, dy: -1}, {dx: 1, dy: 1}, {dx: -1, dy: 1}, {dx: 1, dy: -1},
-      // Medium distance
-      {dx: -2, dy: 0}, {dx: 2, dy: 0}, {dx: 0, dy: -2}, {dx: 0, dy: 2},
-      {dx: -2, dy: -2}, {dx: 2, dy: 2}, {dx: -2, dy: 2}, {dx: 2, dy: -2},
-    ];
-
-    // Add long-distance moves if population is established
-    const totalPop = this.gridUtils.sum(population);
-    if (totalPop > 30) {
-      moves.push(
-        {dx: -5, dy: 0}, {dx: 5, dy: 0}, {dx: 0, dy: -5}, {dx: 0, dy: 5},
-        {dx: -4, dy: -4}, {dx: 4, dy: 4}, {dx: -4, dy: 4}, {dx: 4, dy: -4}
-      );
+    // Read and write the backing arrays directly; the bounds-checked
+    // get/set accessors dominate the per-cell cost in the direction loops.
+    // The output is always a fresh NumericGrid so newData is its real
+    // storage (ArrayGrid.getData() returns a detached flat copy).
+    const popData = population.getData();
+    const newPopulation = new NumericGrid(
+      population.width,
+      population.height,
+      population.cellSizeKm,
+      0
+    );
+    const newData = newPopulation.getData();
+    newData.set(popData);
+    const attrData = attractiveness.getData();
+    // Scan the land mask once per call rather than once per direction
+    const waterMask = landMask ? this.createWaterMask(landMask) : undefined;
+
+    // Total, peak and occupied region of the population in a single scan
+    const scan = this.scanPopulation(popData, population.width, population.height);
+
+    // Only occupied cells can send migrants, and early in a run the herd
+    // covers a tiny fraction of the grid
+    const active = scan.active;
+    if (!active) {
+      return newPopulation;
+    }
+
+    // Long-distance moves only open up once the population is established
+    const moves: MigrationMove[] = [...LOCAL_MOVES];
+    if (scan.total > 30) {
+      moves.push(...ESTABLISHED_MOVES);
     }
 
     // Very long distance for healthy herds
-    const maxPop = this.gridUtils.minMax(population).max;
-    if (maxPop > 8) {
-      moves.push(
-        {dx: -10, dy: 0}, {dx: 10, dy: 0}, {dx: 0, dy: -10}, {dx: 0, dy: 10},
-        {dx: -8, dy: -8}, {dx: 8, dy: 8}
-      );
+    if (scan.max > 8) {
+      moves.push(...LONG_DISTANCE_MOVES);
     }
 
     // Process each direction
     for (const move of moves) {
       this.processMigrationDirection(
-        newPopulation,
+        newData,
+        popData,
+        attrData,
         population,
-        attractiveness,
-        move.dx,
-        move.dy,
+        move,
+        active,
         diffusionRate,
+        maxRate,
         config,
-        landMask
+        waterMask
       );
     }
 
@@ -111,75 +175,125 @@ export class DefaultMigrationService implements MigrationService {
   }
 
   private processMigrationDirection(
-    newPopulation: NumericGrid,
+    newData: Float32Array,
+    popData: ArrayLike<number>,
+    attrData: ArrayLike<number>,
     population: Grid<number>,
-    attractiveness: Grid<number>,
-    dx: number,
-    dy: number,
+    move: MigrationMove,
+    active: ActiveRegion,
     diffusionRate: number,
+    maxRate: number,
     config: MigrationConfig,
-    landMask?: Grid<number>
+    waterMask?: Uint8Array
   ): void {
-    const distance = Math.max(1.0, Math.sqrt(dx * dx + dy * dy));
-    const distanceFactor = 1.0 / Math.pow(distance, 0.8);
-
-    for (let row = 0; row < population.height; row++) {
-      for (let col = 0; col < population.width; col++) {
-        const targetRow = row + dx;
-        const targetCol = col + dy;
-
-        // Check if target is valid
-        if (!config.wrapBoundaries) {
-          if (targetRow < 0 || targetRow >= population.height ||
-              targetCol < 0 || targetCol >= population.width) {
-            continue;
-          }
-        }
+    const { dx, dy, distanceFactor } = move;
+    // Constant for the whole direction pass, so fold it out of the cell loop
+    const rateScale = diffusionRate * distanceFactor;
+    const { width, height } = population;
 
-        // Calculate wrapped coordinates if needed
-        let wrappedRow = targetRow;
-        let wrappedCol = targetCol;
+    // Without wrapping, only sources whose target lands inside the grid can
+    // migrate, so clip the loop bounds instead of testing every cell. Sources
+    // are further limited to the occupied region.
+    const wrap = config.wrapBoundaries;
+    const rowStart = Math.max(active.rowStart, wrap ? 0 : -dx);
+    const rowEnd = Math.min(active.rowEnd, wrap ? height : height - dx);
+    const colStart = Math.max(active.colStart, wrap ? 0 : -dy);
+    const colEnd = Math.min(active.colEnd, wrap ? width : width - dy);
 
-        if (config.wrapBoundaries) {
-          wrappedRow = ((targetRow % population.height) + population.height) % population.height;
-          wrappedCol = ((targetCol % population.width) + population.width) % population.width;
-        }
+    // The target offset is separable: the wrapped row depends only on the
+    // row and the wrapped column only on the column, so resolve the columns
+    // once per direction and the row once per outer iteration
+    const targetCols = new Int32Array(width);
+    for (let col = colStart; col < colEnd; col++) {
+      const targetCol = col + dy;
+      targetCols[col] = wrap ? ((targetCol % width) + width) % width : targetCol;
+    }
+
+    for (let row = rowStart; row < rowEnd; row++) {
+      const targetRow = row + dx;
+      const wrappedRow = wrap ? ((targetRow % height) + height) % height : targetRow;
+
+      for (let col = colStart; col < colEnd; col++) {
+        const sourceIdx = row * width + col;
+        const sourcePop = popData[sourceIdx];
 
-        if (!population.isValid(wrappedRow, wrappedCol)) {
+        // Empty cells have nothing to move
+        if (sourcePop <= 0) {
           continue;
         }
 
+        const targetIdx = wrappedRow * width + targetCols[col];
+
         // Check land mask - don't migrate into water (biomass = 0)
-        if (landMask && landMask.get(wrappedRow, wrappedCol) <= 0) {
+        if (waterMask && waterMask[targetIdx]) {
           continue;
         }
 
         // Calculate attractiveness difference
-        const sourceAttr = attractiveness.get(row, col);
-        const targetAttr = attractiveness.get(wrappedRow, wrappedCol);
+        const sourceAttr = attrData[sourceIdx];
+        const targetAttr = attrData[targetIdx];
         const attrDiff = this.mathUtils.clamp(targetAttr - sourceAttr, -100, 100);
 
         // Add exploration noise
-        const noiseLevel = 0.15;
-        const randomFactor = this.randomUtils.randomNormal(0, noiseLevel);
+        const randomFactor = this.randomUtils.randomNormal(0, EXPLORATION_NOISE);
         const adjustedDiff = attrDiff + randomFactor;
 
         // Calculate migration rate
-        let migrationRate = diffusionRate * distanceFactor * Math.max(-0.1, adjustedDiff);
-        const maxRate = Math.min(0.9, (config.annualMigrationKm / population.cellSizeKm) / 10);
+        let migrationRate = rateScale * Math.max(-0.1, adjustedDiff);
         migrationRate = this.mathUtils.clamp(migrationRate, 0, maxRate);
 
         // Calculate migration amount
-        const sourcePop = population.get(row, col);
         const migration = sourcePop * migrationRate;
 
         // Update populations
-        const currentSource = newPopulation.get(row, col);
-        const currentTarget = newPopulation.get(wrappedRow, wrappedCol);
+        const currentTarget = newData[targetIdx];
+        newData[sourceIdx] = Math.max(0, newData[sourceIdx] - migration);
+        newData[targetIdx] = currentTarget + migration;
+      }
+    }
+  }
+
+  /**
+   * Sum, maximum and bounding box (end-exclusive) of the occupied cells,
+   * gathered in one pass; active is null if no cell is occupied
+   */
+  private scanPopulation(
+    popData: ArrayLike<number>,
+    width: number,
+    height: number
+  ): PopulationScan {
+    let total = 0;
+    let max = -Infinity;
+    let rowStart = height;
+    let rowEnd = 0;
+    let colStart = width;
+    let colEnd = 0;
 
-        newPopulation.set(row, col, Math.max(0, currentSource - migration));
-        newPopulation.set(wrappedRow, wrappedCol, currentTarget + migration);
+    for (let row = 0; row < height; row++) {
+      const offset = row * width;
+      for (let col = 0; col < width; col++) {
+        const pop = popData[offset + col];
+        total += pop;
+        if (pop > max) max = pop;
+        if (pop > 0) {
+          if (row < rowStart) rowStart = row;
+          if (col < colStart) colStart = col;
+          rowEnd = row + 1;
+          if (col >= colEnd) colEnd = col + 1;
+        }
       }
     }
+
+    const active = rowEnd > 0 ? { rowStart, rowEnd, colStart, colEnd } : null;
+    return { total, max, active };
+  }
+
+  private createWaterMask(landMask: Grid<number>): Uint8Array {
+    const data = landMask.getData();
+    const mask = new Uint8Array(data.length);
+    for (let i = 0; i < data.length; i++) {
+      mask[i] = data[i] <= 0 ? 1 : 0;
+    }
+    return mask;
   }
 }
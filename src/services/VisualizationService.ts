@@ -76,10 +76,20 @@ export class CanvasVisualizationService implements VisualizationService {
     if (variable === "foodSatisfaction") {
       max = 1.0;
     } else {
-      // Calculate quantile for better visualization
-      const values = data.flat().filter((v) => v > 0);
-      if (values.length > 0) {
-        values.sort((a, b) => a - b);
+      // Calculate quantile for better visualization. Gather the positive
+      // cells into a typed array so the sort is numeric and comparator-free.
+      const cells = grid.getData();
+      let positiveCount = 0;
+      for (let i = 0; i < cells.length; i++) {
+        if (cells[i] > 0) positiveCount++;
+      }
+      if (positiveCount > 0) {
+        const values = new Float32Array(positiveCount);
+        let next = 0;
+        for (let i = 0; i < cells.length; i++) {
+          if (cells[i] > 0) values[next++] = cells[i];
+        }
+        values.sort();
         const q99 = values[Math.floor(values.length * 0.99)];
         max = q99;
       }
@@ -111,24 +121,20 @@ export class CanvasVisualizationService implements VisualizationService {
     let occupiedCells = 0;
     let populatedCells = 0;
 
-    const pop = state.bison.population;
-    const biomass = state.biomass.current;
-    const satisfaction = state.bison.foodSatisfaction;
+    const pop = state.bison.population.getData();
+    const biomass = state.biomass.current.getData();
+    const satisfaction = state.bison.foodSatisfaction.getData();
 
-    for (let row = 0; row < pop.height; row++) {
-      for (let col = 0; col < pop.width; col++) {
-        const p = pop.get(row, col);
-        const b = biomass.get(row, col);
-        const s = satisfaction.get(row, col);
+    for (let i = 0; i < pop.length; i++) {
+      const p = pop[i];
 
-        totalPopulation += p;
-        totalBiomass += b;
+      totalPopulation += p;
+      totalBiomass += biomass[i];
 
-        if (p > 0) {
-          occupiedCells++;
-          totalSatisfaction += s;
-          populatedCells++;
-        }
+      if (p > 0) {
+        occupiedCells++;
+        totalSatisfaction += satisfaction[i];
+        populatedCells++;
       }
     }
 
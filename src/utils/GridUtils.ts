@@ -11,10 +11,11 @@ export class GridUtils {
       grid.cellSizeKm,
       0
     );
-    for (let row = 0; row < grid.height; row++) {
-      for (let col = 0; col < grid.width; col++) {
-        result.set(row, col, fn(grid.get(row, col)));
-      }
+    // Work on the Float32 storage directly; get/set bounds-check every cell
+    const src = grid.getData();
+    const out = result.getData();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = fn(src[i]);
     }
     return result;
   }
@@ -36,10 +37,11 @@ export class GridUtils {
       grid1.cellSizeKm,
       0
     );
-    for (let row = 0; row < grid1.height; row++) {
-      for (let col = 0; col < grid1.width; col++) {
-        result.set(row, col, fn(grid1.get(row, col), grid2.get(row, col)));
-      }
+    const src1 = grid1.getData();
+    const src2 = grid2.getData();
+    const out = result.getData();
+    for (let i = 0; i < out.length; i++) {
+      out[i] = fn(src1[i], src2[i]);
     }
     return result;
   }
@@ -108,11 +110,10 @@ export class GridUtils {
    * Sum all values in a grid
    */
   sum(grid: Grid<number>): number {
+    const data = grid.getData();
     let total = 0;
-    for (let row = 0; row < grid.height; row++) {
-      for (let col = 0; col < grid.width; col++) {
-        total += grid.get(row, col);
-      }
+    for (let i = 0; i < data.length; i++) {
+      total += data[i];
     }
     return total;
   }
@@ -121,12 +122,11 @@ export class GridUtils {
    * Count cells matching a condition
    */
   count(grid: Grid<number>, predicate: (value: number) => boolean): number {
+    const data = grid.getData();
     let count = 0;
-    for (let row = 0; row < grid.height; row++) {
-      for (let col = 0; col < grid.width; col++) {
-        if (predicate(grid.get(row, col))) {
-          count++;
-        }
+    for (let i = 0; i < data.length; i++) {
+      if (predicate(data[i])) {
+        count++;
       }
     }
     return count;
@@ -202,15 +202,14 @@ export class GridUtils {
    * Get min and max values in grid
    */
   minMax(grid: Grid<number>): { min: number; max: number } {
+    const data = grid.getData();
     let min = Infinity;
     let max = -Infinity;
 
-    for (let row = 0; row < grid.height; row++) {
-      for (let col = 0; col < grid.width; col++) {
-        const val = grid.get(row, col);
-        if (val < min) min = val;
-        if (val > max) max = val;
-      }
+    for (let i = 0; i < data.length; i++) {
+      const val = data[i];
+      if (val < min) min = val;
+      if (val > max) max = val;
     }
 
     return { min, max };
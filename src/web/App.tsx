@@ -16,12 +16,47 @@ interface GridInfo {
 
 interface YearState {
   year: number;
+  width: number;
+  height: number;
+  biomass: Float32Array;
+  population: Float32Array;
+  foodSatisfaction: Float32Array;
+  carryingCapacity: Float32Array;
+}
+
+interface ServerGridState {
   biomass: number[][];
   population: number[][];
   foodSatisfaction: number[][];
   carryingCapacity: number[][];
 }
 
+// Flatten a row-major grid from the server into Float32 storage
+const flattenGrid = (rows: number[][], width: number): Float32Array => {
+  const data = new Float32Array(rows.length * width);
+  for (let row = 0; row < rows.length; row++) {
+    data.set(rows[row], row * width);
+  }
+  return data;
+};
+
+// Convert the nested JSON arrays once on receipt. Year states are kept for
+// the whole run and redrawn on every render, so hold them as flat typed
+// arrays rather than rebuilding grids from number[][] each time.
+const toYearState = (year: number, state: ServerGridState): YearState => {
+  const height = state.biomass.length;
+  const width = height > 0 ? state.biomass[0].length : 0;
+  return {
+    year,
+    width,
+    height,
+    biomass: flattenGrid(state.biomass, width),
+    population: flattenGrid(state.population, width),
+    foodSatisfaction: flattenGrid(state.foodSatisfaction, width),
+    carryingCapacity: flattenGrid(state.carryingCapacity, width),
+  };
+};
+
 export const App: React.FC = () => {
   // Server state
   const [serverStatus, setServerStatus] = useState<"checking" | "online" | "offline">("checking");
@@ -140,13 +175,7 @@ export const App: React.FC = () => {
       const data = await response.json();
       setCellSizeKm(data.metadata.cellSizeKm);
 
-      const initialState: YearState = {
-        year: 0,
-        biomass: data.state.biomass,
-        population: data.state.population,
-        foodSatisfaction: data.state.foodSatisfaction,
-        carryingCapacity: data.state.carryingCapacity,
-      };
+      const initialState = toYearState(0, data.state);
 
       setYearStates([initialState]);
       setSelectedVariable("populationOverlay");
@@ -178,19 +207,10 @@ export const App: React.FC = () => {
         const data = await response.json();
         setStepTime(data.stepTimeMs);
 
-        const newState: YearState = {
-          year: data.year,
-          biomass: data.state.biomass,
-          population: data.state.population,
-          foodSatisfaction: data.state.foodSatisfaction,
-          carryingCapacity: data.state.carryingCapacity,
-        };
+        const newState = toYearState(data.year, data.state);
 
         // Calculate total population from the grid
-        const popSum = data.state.population.reduce(
-          (sum: number, row: number[]) => sum + row.reduce((s: number, v: number) => s + v, 0),
-          0
-        );
+        const popSum = newState.population.reduce((sum, v) => sum + v, 0);
         setTotalPopulation(Math.round(popSum));
 
         setYearStates((prev) => {
@@ -249,38 +269,44 @@ export const App: React.FC = () => {
     const yearData = yearStates[viewingYear];
 
     if (yearData) {
+      const toGrid = (data: Float32Array) =>
+        NumericGrid.fromFloat32Array(data, yearData.width, yearData.height, cellSizeKm);
+      // The canvas only reads these grids, so fields showing the same data share one
+      const biomass = toGrid(yearData.biomass);
+      const population = toGrid(yearData.population);
       return {
         year: yearData.year,
         biomass: {
-          current: NumericGrid.fromArray(yearData.biomass, cellSizeKm),
-          max: NumericGrid.fromArray(yearData.biomass, cellSizeKm),
-          digestible: NumericGrid.fromArray(yearData.biomass, cellSizeKm),
-          sustainableHarvest: NumericGrid.fromArray(yearData.biomass, cellSizeKm),
+          current: biomass,
+          max: biomass,
+          digestible: biomass,
+          sustainableHarvest: biomass,
         },
         bison: {
-          population: NumericGrid.fromArray(yearData.population, cellSizeKm),
-          foodDemand: NumericGrid.fromArray(yearData.population, cellSizeKm),
-          foodSatisfaction: NumericGrid.fromArray(yearData.foodSatisfaction, cellSizeKm),
-          carryingCapacity: NumericGrid.fromArray(yearData.carryingCapacity, cellSizeKm),
+          population,
+          foodDemand: population,
+          foodSatisfaction: toGrid(yearData.foodSatisfaction),
+          carryingCapacity: toGrid(yearData.carryingCapacity),
         },
       };
     }
 
     if (initialBiomass) {
-      const emptyGrid = initialBiomass.map((row) => row.map(() => 0));
+      const biomass = NumericGrid.fromArray(initialBiomass, cellSizeKm);
+      const emptyGrid = new NumericGrid(biomass.width, biomass.height, cellSizeKm, 0);
       return {
         year: 0,
         biomass: {
-          current: NumericGrid.fromArray(initialBiomass, cellSizeKm),
-          max: NumericGrid.fromArray(initialBiomass, cellSizeKm),
-          digestible: NumericGrid.fromArray(initialBiomass, cellSizeKm),
-          sustainableHarvest: NumericGrid.fromArray(initialBiomass, cellSizeKm),
+          current: biomass,
+          max: biomass,
+          digestible: biomass,
+          sustainableHarvest: biomass,
         },
         bison: {
-          population: NumericGrid.fromArray(emptyGrid, cellSizeKm),
-          foodDemand: NumericGrid.fromArray(emptyGrid, cellSizeKm),
-          foodSatisfaction: NumericGrid.fromArray(emptyGrid, cellSizeKm),
-          carryingCapacity: NumericGrid.fromArray(emptyGrid, cellSizeKm),
+          population: emptyGrid,
+          foodDemand: emptyGrid,
+          foodSatisfaction: emptyGrid,
+          carryingCapacity: emptyGrid,
         },
       };
     }